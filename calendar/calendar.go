@@ -15,28 +15,39 @@ const (
 	HK     CalendarID = "HK"
 )
 
+// holidayKey packs a calendar date into a yyyymmdd integer so holiday lookups
+// avoid formatting a date string on every business-day check.
+func holidayKey(t time.Time) int {
+	y, m, d := t.Date()
+	return y*10000 + int(m)*100 + d
+}
+
 // buildHolidayMap creates a holiday lookup map from a list of date strings.
 // This is a shared factory function to eliminate duplicate init code.
-func buildHolidayMap(holidays []string) map[string]struct{} {
-	m := make(map[string]struct{}, len(holidays))
+func buildHolidayMap(holidays []string) map[int]struct{} {
+	m := make(map[int]struct{}, len(holidays))
 	for _, h := range holidays {
-		m[h] = struct{}{}
+		t, err := time.Parse("2006-01-02", h)
+		if err != nil {
+			panic("invalid holiday date: " + h)
+		}
+		m[holidayKey(t)] = struct{}{}
 	}
 	return m
 }
 
 // Holiday maps are initialized using buildHolidayMap.
 // Each calendar file (japan.go, target.go, korea.go) defines its holiday list.
-var targetHolidays = map[string]struct{}{}
-var jpHolidays = map[string]struct{}{}
-var fdHolidays = map[string]struct{}{}
-var gtHolidays = map[string]struct{}{}
-var enHolidays = map[string]struct{}{}
+var targetHolidays = map[int]struct{}{}
+var jpHolidays = map[int]struct{}{}
+var fdHolidays = map[int]struct{}{}
+var gtHolidays = map[int]struct{}{}
+var enHolidays = map[int]struct{}{}
 var krHolidays = buildHolidayMap(krHolidayList)
-var hkHolidays map[string]struct{} // populated in hongkong.go init()
+var hkHolidays map[int]struct{} // populated in hongkong.go init()
 
 func isHoliday(cal CalendarID, t time.Time) bool {
-	key := t.Format("2006-01-02")
+	key := holidayKey(t)
 	switch cal {
 	case TARGET:
 		_, ok := targetHolidays[key]
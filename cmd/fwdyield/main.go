@@ -83,12 +83,11 @@ func main() {
 		outputs = append(outputs, *out)
 	}
 
+	enc := json.NewEncoder(os.Stdout)
 	if isArray {
-		b, _ := json.Marshal(outputs)
-		fmt.Println(string(b))
+		enc.Encode(outputs)
 	} else {
-		b, _ := json.Marshal(outputs[0])
-		fmt.Println(string(b))
+		enc.Encode(outputs[0])
 	}
 
 	if hadError {
@@ -7,7 +7,9 @@ import (
 	"fmt"
 	"io"
 	"os"
+	"runtime"
 	"strings"
+	"sync"
 	"time"
 
 	"github.com/meenmo/molib/bond/greeks"
@@ -96,24 +98,50 @@ func main() {
 		exitError(fmt.Sprintf("parse JSON: %v", err))
 	}
 
+	// Contracts are independent: fan out across CPUs, write into a pre-sized
+	// slice indexed by input position so output order matches input order.
+	outputs := make([]ktbOutput, len(inputs))
+	workers := runtime.NumCPU()
+	if workers > len(inputs) {
+		workers = len(inputs)
+	}
+
+	jobs := make(chan int, len(inputs))
+	var wg sync.WaitGroup
+	for w := 0; w < workers; w++ {
+		wg.Add(1)
+		go func() {
+			defer wg.Done()
+			for i := range jobs {
+				in := inputs[i]
+				out, err := process(in)
+				if err != nil {
+					outputs[i] = ktbOutput{Date: in.Today, FuturesCode: in.FuturesCode, Error: err.Error()}
+					continue
+				}
+				outputs[i] = *out
+			}
+		}()
+	}
+	for i := range inputs {
+		jobs <- i
+	}
+	close(jobs)
+	wg.Wait()
+
 	hadError := false
-	outputs := make([]ktbOutput, 0, len(inputs))
-	for _, in := range inputs {
-		out, err := process(in)
-		if err != nil {
+	for _, o := range outputs {
+		if o.Error != "" {
 			hadError = true
-			outputs = append(outputs, ktbOutput{Date: in.Today, FuturesCode: in.FuturesCode, Error: err.Error()})
-			continue
+			break
 		}
-		outputs = append(outputs, *out)
 	}
 
+	enc := json.NewEncoder(os.Stdout)
 	if isArray {
-		b, _ := json.Marshal(outputs)
-		fmt.Println(string(b))
+		enc.Encode(outputs)
 	} else {
-		b, _ := json.Marshal(outputs[0])
-		fmt.Println(string(b))
+		enc.Encode(outputs[0])
 	}
 
 	if hadError {
@@ -193,12 +193,11 @@ func main() {
 		}
 	}
 
+	enc := json.NewEncoder(os.Stdout)
 	if isArray {
-		outputBytes, _ := json.Marshal(outputs)
-		fmt.Println(string(outputBytes))
+		enc.Encode(outputs)
 	} else {
-		outputBytes, _ := json.Marshal(outputs[0])
-		fmt.Println(string(outputBytes))
+		enc.Encode(outputs[0])
 	}
 
 	if hadError {
@@ -2,6 +2,7 @@ package swap
 
 import (
 	"fmt"
+	"sync"
 	"time"
 
 	"github.com/meenmo/molib/calendar"
@@ -214,13 +215,25 @@ func InterestRateSwap(params InterestRateSwapParams) (*SwapTrade, error) {
 		return curve.BuildProjectionCurve(curveSettlement, leg, quotes, disc), nil
 	}
 
-	projPay, err := buildProj(params.PayLeg, params.PayLegQuotes)
-	if err != nil {
-		return nil, fmt.Errorf("InterestRateSwap: pay leg: %w", err)
+	// The two projection curves only read the discount curve, so bootstrap them
+	// concurrently (each IBOR leg is a full dual-curve bootstrap).
+	var (
+		projPay, projRec ProjectionCurve
+		errPay, errRec   error
+		wg               sync.WaitGroup
+	)
+	wg.Add(1)
+	go func() {
+		defer wg.Done()
+		projRec, errRec = buildProj(params.RecLeg, params.RecLegQuotes)
+	}()
+	projPay, errPay = buildProj(params.PayLeg, params.PayLegQuotes)
+	wg.Wait()
+	if errPay != nil {
+		return nil, fmt.Errorf("InterestRateSwap: pay leg: %w", errPay)
 	}
-	projRec, err := buildProj(params.RecLeg, params.RecLegQuotes)
-	if err != nil {
-		return nil, fmt.Errorf("InterestRateSwap: receive leg: %w", err)
+	if errRec != nil {
+		return nil, fmt.Errorf("InterestRateSwap: receive leg: %w", errRec)
 	}
 
 	spec := market.SwapSpec{
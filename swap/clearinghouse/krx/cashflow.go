@@ -9,7 +9,7 @@ import (
 	"github.com/meenmo/molib/utils"
 )
 
-func (irs InterestRateSwap) legCashflows(curve *Curve) (map[time.Time]float64, map[time.Time]float64) {
+func (irs InterestRateSwap) legCashflows(curve *Curve, settlement time.Time) (map[time.Time]float64, map[time.Time]float64) {
 	fixed := make(map[time.Time]float64)
 	floating := make(map[time.Time]float64)
 
@@ -20,14 +20,15 @@ func (irs InterestRateSwap) legCashflows(curve *Curve) (map[time.Time]float64, m
 
 	effective := utils.DateParser(irs.EffectiveDate)
 	termination := utils.DateParser(irs.TerminationDate)
-	settlement := utils.DateParser(irs.SettlementDate)
 
 	if !(strings.ToUpper(string(irs.Direction)) == "REC" || strings.ToUpper(string(irs.Direction)) == "PAY") {
 		panic("invalid direction: must be REC or PAY")
 	}
 
-	for i := 0; calendar.Adjust(calendar.KR, utils.AddMonth(effective, 3*i)).Before(termination.AddDate(0, 0, 1)); i++ {
-		if calendar.IsEndOfMonth(calendar.KR, effective) {
+	isEOM := calendar.IsEndOfMonth(calendar.KR, effective)
+	lastRoll := termination.AddDate(0, 0, 1)
+	for i := 0; calendar.Adjust(calendar.KR, utils.AddMonth(effective, 3*i)).Before(lastRoll); i++ {
+		if isEOM {
 			payDate = calendar.LastBusinessDayOfMonth(calendar.KR, utils.AddMonth(effective, 3*i))
 		} else {
 			payDate = calendar.Adjust(calendar.KR, utils.AddMonth(effective, 3*i))
@@ -87,8 +88,7 @@ func (irs InterestRateSwap) legCashflows(curve *Curve) (map[time.Time]float64, m
 	return fixed, floating
 }
 
-func (irs InterestRateSwap) discountCashflows(cfs map[time.Time]float64, curve *Curve) map[time.Time]float64 {
-	settlement := utils.DateParser(irs.SettlementDate)
+func discountCashflows(cfs map[time.Time]float64, curve *Curve, settlement time.Time) map[time.Time]float64 {
 	for payDate, cf := range cfs {
 		df := utils.RoundTo(math.Exp(-(utils.Days(settlement, payDate)/365)*(curve.ZeroRateAt(payDate)/100)), 12)
 		cfs[payDate] = df * cf
@@ -97,9 +97,11 @@ func (irs InterestRateSwap) discountCashflows(cfs map[time.Time]float64, curve *
 }
 
 func (irs InterestRateSwap) PVByLeg(curve *Curve) (float64, float64) {
-	fixedCF, floatingCF := irs.legCashflows(curve)
-	pvFixed := irs.discountCashflows(fixedCF, curve)
-	pvFloating := irs.discountCashflows(floatingCF, curve)
+	// Parse the settlement date once for cashflow generation and both discounting passes.
+	settlement := utils.DateParser(irs.SettlementDate)
+	fixedCF, floatingCF := irs.legCashflows(curve, settlement)
+	pvFixed := discountCashflows(fixedCF, curve, settlement)
+	pvFloating := discountCashflows(floatingCF, curve, settlement)
 
 	var sumFixed, sumFloating float64
 	for _, pv := range pvFixed {
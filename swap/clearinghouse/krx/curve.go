@@ -56,7 +56,7 @@ func (crv Curve) buildSwapCurve() map[time.Time]float64 {
 		if rate, ok := crv.swapQuotes[tenor]; ok {
 			swap[d] = rate / 100
 		} else {
-			d1, d2 := adjacentQuotedDates(d, paymentDates, crv.swapQuotes)
+			d1, d2 := adjacentQuotedDates(d, paymentDates, dateToTenor, crv.swapQuotes)
 			r1 := crv.swapQuotes[dateToTenor[d1]]
 			r2 := crv.swapQuotes[dateToTenor[d2]]
 			swap[d] = (r1 + (r2-r1)*utils.Days(d1, d)/utils.Days(d1, d2)) / 100
@@ -71,24 +71,20 @@ func (crv Curve) buildDiscountFactors() map[time.Time]float64 {
 	paymentDates := crv.paymentDates
 
 	prevDate := paymentDates[0]
-	numerator := 0.0
 	df[prevDate] = 1
 
+	// annuity accumulates Days(d_{k-1}, d_k) * DF(d_k) over the dates solved so
+	// far, so each pillar extends it by one term instead of re-summing from the start.
+	annuity := 0.0
 	for i, date := range paymentDates[1:] {
 		rate := swapCurve[date]
-		if i == 0 {
-			numerator = 1
-		} else {
-			prevDate2 := paymentDates[0]
-			for _, d := range paymentDates[1 : i+1] {
-				numerator += utils.Days(prevDate2, d) * df[d]
-				prevDate2 = d
-			}
-			numerator = 1 - (numerator/365)*rate
+		numerator := 1.0
+		if i > 0 {
+			numerator = 1 - (annuity/365)*rate
 		}
 		df[date] = utils.RoundTo(numerator/(1+rate*utils.Days(prevDate, date)/365), 12)
+		annuity += utils.Days(prevDate, date) * df[date]
 		prevDate = date
-		numerator = 0
 	}
 	return df
 }
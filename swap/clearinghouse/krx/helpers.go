@@ -84,11 +84,11 @@ func paymentDatesToTenors(dates []time.Time) map[time.Time]float64 {
 }
 
 // adjacentQuotedDates finds the nearest quoted tenors surrounding a target date.
-func adjacentQuotedDates(target time.Time, dates []time.Time, quotes ParSwapQuotes) (time.Time, time.Time) {
+// dateTenor is the paymentDatesToTenors map for dates, built once by the caller.
+func adjacentQuotedDates(target time.Time, dates []time.Time, dateTenor map[time.Time]float64, quotes ParSwapQuotes) (time.Time, time.Time) {
 	d1 := dates[0]
 	d2 := dates[1]
 
-	dateTenor := paymentDatesToTenors(dates)
 	for _, d := range dates[2:] {
 		if d1.Before(target) && target.Before(d2) {
 			return d1, d2
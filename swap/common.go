@@ -4,6 +4,7 @@ import (
 	"fmt"
 	"math"
 	"reflect"
+	"slices"
 	"time"
 
 	"github.com/meenmo/molib/calendar"
@@ -85,6 +86,14 @@ func generateScheduleForward(effective, maturity time.Time, leg market.LegConven
 	start := effective
 	var prevAdjustedEnd time.Time // Track the previous period's adjusted end for chaining
 
+	// OIS swaps (overnight rates) use chained accrual periods per Bloomberg SWPM convention
+	isOIS := market.IsOvernight(leg.ReferenceIndex)
+
+	fixCal := leg.FixingCalendar
+	if fixCal == "" {
+		fixCal = leg.Calendar
+	}
+
 	for start.Before(maturity) {
 		// Generate unadjusted period end, then cap to maturity to create a final stub if needed.
 		var endUnadj time.Time
@@ -97,9 +106,6 @@ func generateScheduleForward(effective, maturity time.Time, leg market.LegConven
 			endUnadj = maturity
 		}
 
-		// OIS swaps (overnight rates) use chained accrual periods per Bloomberg SWPM convention
-		isOIS := market.IsOvernight(leg.ReferenceIndex)
-
 		// For OIS, chain from previous period's end; for others, use independent periods
 		var accrualStart time.Time
 		if isOIS && !prevAdjustedEnd.IsZero() {
@@ -110,11 +116,6 @@ func generateScheduleForward(effective, maturity time.Time, leg market.LegConven
 		accrualEnd := calendar.Adjust(leg.Calendar, endUnadj)
 		paymentDate := calendar.AddBusinessDays(leg.Calendar, accrualEnd, leg.PayDelayDays)
 
-		fixCal := leg.FixingCalendar
-		if fixCal == "" {
-			fixCal = leg.Calendar
-		}
-
 		fixingDate := calendar.AddBusinessDays(fixCal, accrualStart, -leg.FixingLagDays)
 		if leg.ResetPosition == market.ResetInArrears {
 			fixingDate = calendar.AddBusinessDays(fixCal, accrualEnd, -(leg.RateCutoffDays + leg.FixingLagDays))
@@ -151,13 +152,15 @@ func generateScheduleBackward(effective, maturity time.Time, leg market.LegConve
 	var unadjustedDates []time.Time
 	current := maturity
 	for current.After(effective) {
-		unadjustedDates = append([]time.Time{current}, unadjustedDates...)
+		unadjustedDates = append(unadjustedDates, current)
 		if leg.RollConvention == market.BackwardEOM {
 			current = utils.AddMonth(current, -months)
 		} else {
 			current = current.AddDate(0, -months, 0)
 		}
 	}
+	// Collected newest-first; reverse once instead of prepending each date.
+	slices.Reverse(unadjustedDates)
 
 	// If the first backward-rolled date is very close to effective (within 7 days),
 	// skip it to avoid creating a tiny stub period (Bloomberg convention).
@@ -174,6 +177,11 @@ func generateScheduleBackward(effective, maturity time.Time, leg market.LegConve
 	// Prepend effective date as the start of the first (potentially stub) period
 	unadjustedDates = append([]time.Time{effective}, unadjustedDates...)
 
+	fixCal := leg.FixingCalendar
+	if fixCal == "" {
+		fixCal = leg.Calendar
+	}
+
 	// Build periods from consecutive date pairs
 	periods := make([]SchedulePeriod, 0, len(unadjustedDates)-1)
 	for i := 0; i < len(unadjustedDates)-1; i++ {
@@ -185,11 +193,6 @@ func generateScheduleBackward(effective, maturity time.Time, leg market.LegConve
 
 		paymentDate := calendar.AddBusinessDays(leg.Calendar, accrualEnd, leg.PayDelayDays)
 
-		fixCal := leg.FixingCalendar
-		if fixCal == "" {
-			fixCal = leg.Calendar
-		}
-
 		fixingDate := calendar.AddBusinessDays(fixCal, accrualStart, -leg.FixingLagDays)
 		if leg.ResetPosition == market.ResetInArrears {
 			fixingDate = calendar.AddBusinessDays(fixCal, accrualEnd, -(leg.RateCutoffDays + leg.FixingLagDays))
@@ -280,9 +283,23 @@ func validateSwapSpec(spec market.SwapSpec) error {
 	return nil
 }
 
+// legSchedules generates the pay and receive leg schedules for spec.
+func legSchedules(spec market.SwapSpec) (pay, rec []SchedulePeriod, err error) {
+	pay, err = GenerateSchedule(spec.EffectiveDate, spec.MaturityDate, spec.PayLeg)
+	if err != nil {
+		return nil, nil, fmt.Errorf("pay leg: %w", err)
+	}
+	rec, err = GenerateSchedule(spec.EffectiveDate, spec.MaturityDate, spec.RecLeg)
+	if err != nil {
+		return nil, nil, fmt.Errorf("receive leg: %w", err)
+	}
+	return pay, rec, nil
+}
+
 func legPV(
 	spec market.SwapSpec,
 	leg market.LegConvention,
+	periods []SchedulePeriod,
 	projCurve ProjectionCurve,
 	discCurve DiscountCurve,
 	valuationDate time.Time,
@@ -296,11 +313,6 @@ func legPV(
 		return 0, ErrNilCurve
 	}
 
-	periods, err := GenerateSchedule(spec.EffectiveDate, spec.MaturityDate, leg)
-	if err != nil {
-		return 0, err
-	}
-
 	spread := spreadBP * 1e-4
 
 	signCoupon := 1.0
@@ -365,13 +377,26 @@ func NPV(spec market.SwapSpec, projPay ProjectionCurve, projRec ProjectionCurve,
 		return 0, ErrNilCurve
 	}
 
-	pvPay, err := legPV(spec, spec.PayLeg, projPay, discCurve, valuationDate, spec.PayLegSpreadBP, true)
+	payPeriods, recPeriods, err := legSchedules(spec)
 	if err != nil {
-		return 0, fmt.Errorf("NPV: pay leg: %w", err)
+		return 0, fmt.Errorf("NPV: %w", err)
 	}
-	pvRec, err := legPV(spec, spec.RecLeg, projRec, discCurve, valuationDate, spec.RecLegSpreadBP, false)
+	npv, err := legsNPV(spec, payPeriods, recPeriods, projPay, projRec, discCurve, valuationDate)
 	if err != nil {
-		return 0, fmt.Errorf("NPV: receive leg: %w", err)
+		return 0, fmt.Errorf("NPV: %w", err)
+	}
+	return npv, nil
+}
+
+// legsNPV sums the leg PVs over pre-generated pay and receive leg schedules.
+func legsNPV(spec market.SwapSpec, payPeriods, recPeriods []SchedulePeriod, projPay ProjectionCurve, projRec ProjectionCurve, discCurve DiscountCurve, valuationDate time.Time) (float64, error) {
+	pvPay, err := legPV(spec, spec.PayLeg, payPeriods, projPay, discCurve, valuationDate, spec.PayLegSpreadBP, true)
+	if err != nil {
+		return 0, fmt.Errorf("pay leg: %w", err)
+	}
+	pvRec, err := legPV(spec, spec.RecLeg, recPeriods, projRec, discCurve, valuationDate, spec.RecLegSpreadBP, false)
+	if err != nil {
+		return 0, fmt.Errorf("receive leg: %w", err)
 	}
 
 	return pvPay + pvRec, nil
@@ -386,11 +411,16 @@ func PVByLeg(spec market.SwapSpec, projPay ProjectionCurve, projRec ProjectionCu
 		return PV{}, ErrNilCurve
 	}
 
-	pvPay, err := legPV(spec, spec.PayLeg, projPay, discCurve, valuationDate, spec.PayLegSpreadBP, true)
+	payPeriods, recPeriods, err := legSchedules(spec)
+	if err != nil {
+		return PV{}, fmt.Errorf("PVByLeg: %w", err)
+	}
+
+	pvPay, err := legPV(spec, spec.PayLeg, payPeriods, projPay, discCurve, valuationDate, spec.PayLegSpreadBP, true)
 	if err != nil {
 		return PV{}, fmt.Errorf("PVByLeg: pay leg: %w", err)
 	}
-	pvRec, err := legPV(spec, spec.RecLeg, projRec, discCurve, valuationDate, spec.RecLegSpreadBP, false)
+	pvRec, err := legPV(spec, spec.RecLeg, recPeriods, projRec, discCurve, valuationDate, spec.RecLegSpreadBP, false)
 	if err != nil {
 		return PV{}, fmt.Errorf("PVByLeg: receive leg: %w", err)
 	}
@@ -401,31 +431,29 @@ func PVByLeg(spec market.SwapSpec, projPay ProjectionCurve, projRec ProjectionCu
 	}, nil
 }
 
-func pv01TargetLegPerDec(spec market.SwapSpec, discCurve DiscountCurve, valuationDate time.Time, target SpreadTarget) (float64, error) {
+func pv01TargetLegPerDec(spec market.SwapSpec, payPeriods, recPeriods []SchedulePeriod, discCurve DiscountCurve, valuationDate time.Time, target SpreadTarget) (float64, error) {
 	if isNilInterface(discCurve) {
 		return 0, ErrNilCurve
 	}
 
 	var (
-		leg  market.LegConvention
-		sign float64
+		leg     market.LegConvention
+		periods []SchedulePeriod
+		sign    float64
 	)
 	switch target {
 	case SpreadTargetPayLeg:
 		leg = spec.PayLeg
+		periods = payPeriods
 		sign = -1.0
 	case SpreadTargetRecLeg:
 		leg = spec.RecLeg
+		periods = recPeriods
 		sign = 1.0
 	default:
 		return 0, fmt.Errorf("pv01TargetLegPerDec: unknown target %d", target)
 	}
 
-	periods, err := GenerateSchedule(spec.EffectiveDate, spec.MaturityDate, leg)
-	if err != nil {
-		return 0, err
-	}
-
 	pv01 := 0.0
 	for _, p := range periods {
 		if p.PayDate.Before(valuationDate) {
@@ -449,7 +477,14 @@ func SolveParSpread(spec market.SwapSpec, projPay ProjectionCurve, projRec Proje
 		return 0, ErrNilCurve
 	}
 
-	pv01Dec, err := pv01TargetLegPerDec(spec, discCurve, valuationDate, target)
+	// Schedules depend only on the trade dates and leg conventions, not on the
+	// spread being solved, so generate them once for the PV01 and every iteration.
+	payPeriods, recPeriods, err := legSchedules(spec)
+	if err != nil {
+		return 0, fmt.Errorf("SolveParSpread: %w", err)
+	}
+
+	pv01Dec, err := pv01TargetLegPerDec(spec, payPeriods, recPeriods, discCurve, valuationDate, target)
 	if err != nil {
 		return 0, err
 	}
@@ -477,9 +512,9 @@ func SolveParSpread(spec market.SwapSpec, projPay ProjectionCurve, projRec Proje
 			return 0, fmt.Errorf("SolveParSpread: unknown target %d", target)
 		}
 
-		npv, err := NPV(tmp, projPay, projRec, discCurve, valuationDate)
+		npv, err := legsNPV(tmp, payPeriods, recPeriods, projPay, projRec, discCurve, valuationDate)
 		if err != nil {
-			return 0, err
+			return 0, fmt.Errorf("NPV: %w", err)
 		}
 		if math.Abs(npv) <= tolPV {
 			return spreadBP, nil
@@ -494,7 +529,7 @@ func SolveParSpread(spec market.SwapSpec, projPay ProjectionCurve, projRec Proje
 	} else {
 		tmp.RecLegSpreadBP = spreadBP
 	}
-	npv, _ := NPV(tmp, projPay, projRec, discCurve, valuationDate)
+	npv, _ := legsNPV(tmp, payPeriods, recPeriods, projPay, projRec, discCurve, valuationDate)
 	return spreadBP, fmt.Errorf("SolveParSpread: did not converge (spread=%.12f bp, npv=%.6g)", spreadBP, npv)
 }
 
@@ -2,6 +2,7 @@ package curve
 
 import (
 	"math"
+	"slices"
 	"time"
 
 	"github.com/meenmo/molib/calendar"
@@ -56,8 +57,9 @@ func BuildCurve(settlement time.Time, quotes map[string]float64, cal calendar.Ca
 		fixedLegDC:    FixedLegDayCountOIS,
 	}
 	c.paymentDates = c.generatePaymentDates()
-	c.parRates = c.buildParCurve()
-	c.discountFactors = c.bootstrapDiscountFactors()
+	dateToTenor := c.paymentDatesToTenor()
+	c.parRates = c.buildParCurve(dateToTenor)
+	c.discountFactors = c.bootstrapDiscountFactors(dateToTenor)
 	c.zeros = c.buildZero()
 	return c
 }
@@ -80,8 +82,9 @@ func BuildIBORDiscountCurve(settlement time.Time, quotes map[string]float64, cal
 		fixedLegDC:    FixedLegDayCountIBOR,
 	}
 	c.paymentDates = c.generatePaymentDates()
-	c.parRates = c.buildParCurve()
-	c.discountFactors = c.bootstrapDiscountFactors()
+	dateToTenor := c.paymentDatesToTenor()
+	c.parRates = c.buildParCurve(dateToTenor)
+	c.discountFactors = c.bootstrapDiscountFactors(dateToTenor)
 	c.zeros = c.buildZero()
 	return c
 }
@@ -188,9 +191,8 @@ func (c *Curve) getMaxTenorMonths() int {
 	return int(maxYears*12) + 12
 }
 
-func (c *Curve) buildParCurve() map[time.Time]float64 {
+func (c *Curve) buildParCurve(dateToTenor map[time.Time]float64) map[time.Time]float64 {
 	par := make(map[time.Time]float64, len(c.paymentDates))
-	dateToTenor := c.paymentDatesToTenor()
 	for _, d := range c.paymentDates {
 		tenor := dateToTenor[d]
 		if rate, ok := c.parQuotes[tenor]; ok {
@@ -205,14 +207,13 @@ func (c *Curve) buildParCurve() map[time.Time]float64 {
 	return par
 }
 
-func (c *Curve) bootstrapDiscountFactors() map[time.Time]float64 {
+func (c *Curve) bootstrapDiscountFactors(dateToTenor map[time.Time]float64) map[time.Time]float64 {
 	df := make(map[time.Time]float64, len(c.paymentDates))
 	dates := c.paymentDates
 
 	// First pillar at settlement has DF = 1.0
 	df[dates[0]] = 1.0
 
-	dateToTenor := c.paymentDatesToTenor()
 	quotedDates := []time.Time{dates[0]}
 	for _, d := range dates[1:] {
 		tenor := dateToTenor[d]
@@ -320,14 +321,16 @@ func (c *Curve) buildOISCoupons(maturity time.Time) []oisCoupon {
 	// must align to the swap maturity date.
 	months := 12
 
-	// Build unadjusted dates rolling backward from maturity.
+	// Build unadjusted dates rolling backward from maturity, then reverse once
+	// rather than prepending (which copies the slice on every step).
 	unadjustedDates := []time.Time{}
 	current := maturity
 	for current.After(c.settlement) {
-		unadjustedDates = append([]time.Time{current}, unadjustedDates...)
+		unadjustedDates = append(unadjustedDates, current)
 		current = utils.AddMonth(current, -months)
 	}
-	unadjustedDates = append([]time.Time{c.settlement}, unadjustedDates...)
+	unadjustedDates = append(unadjustedDates, c.settlement)
+	slices.Reverse(unadjustedDates)
 
 	// Build coupons from consecutive date pairs.
 	for i := 0; i < len(unadjustedDates)-1; i++ {
@@ -464,7 +467,7 @@ func (c *Curve) interpolateUnknownDF(t, start time.Time, dfStart float64, end ti
 // For each quoted tenor, it solves for the pseudo-DF that makes the IBOR swap NPV = 0
 // when discounted at OIS rates. The floatFreqMonths parameter specifies the frequency
 // of the floating leg during bootstrap (e.g., 3 for 3M, 6 for 6M).
-func (c *Curve) bootstrapDualCurve(oisCurve *Curve, floatFreqMonths int) map[time.Time]float64 {
+func (c *Curve) bootstrapDualCurve(dateToTenor map[time.Time]float64, oisCurve *Curve, floatFreqMonths int) map[time.Time]float64 {
 	dates := c.paymentDates
 	pseudoDF := make(map[time.Time]float64, len(dates))
 
@@ -472,7 +475,6 @@ func (c *Curve) bootstrapDualCurve(oisCurve *Curve, floatFreqMonths int) map[tim
 	pseudoDF[dates[0]] = 1.0
 
 	// Get quoted dates
-	dateToTenor := c.paymentDatesToTenor()
 	quotedDates := []time.Time{dates[0]}
 	for _, d := range dates[1:] {
 		tenor := dateToTenor[d]
@@ -531,13 +533,24 @@ func (c *Curve) solvePseudoDiscountFactor(quotedDates []time.Time, pseudoDF map[
 		guess = oisCurve.DF(maturity)
 	}
 
+	// Schedules, OIS discount factors and the fixed leg PV do not depend on the
+	// unknown pseudo-DF, so build them once rather than on every iteration.
+	legs := c.buildIBORSwapLegs(quotedDates, oisCurve, parRate, floatFreqMonths)
+
+	// Working copy of the solved pseudo-DFs; only the maturity entry changes
+	// between iterations.
+	tempPseudoDF := make(map[time.Time]float64, len(pseudoDF)+1)
+	for k, v := range pseudoDF {
+		tempPseudoDF[k] = v
+	}
+
 	// Newton-Raphson solver
 	tolerance := 1e-12
 	maxIter := 100
 
 	for iter := 0; iter < maxIter; iter++ {
 		// Calculate NPV and derivative using specified float frequency
-		npv, derivative := c.evalIBORSwapNPV(quotedDates, pseudoDF, oisCurve, parRate, guess, floatFreqMonths)
+		npv, derivative := c.evalIBORSwapNPV(quotedDates, tempPseudoDF, legs, guess)
 
 		// Robust checks for NaN/Inf
 		if math.IsNaN(npv) || math.IsInf(npv, 0) || math.IsNaN(derivative) || math.IsInf(derivative, 0) {
@@ -575,8 +588,18 @@ func (c *Curve) solvePseudoDiscountFactor(quotedDates []time.Time, pseudoDF map[
 	return guess
 }
 
-// evalIBORSwapNPV evaluates IBOR swap NPV using the specified floating leg frequency.
-func (c *Curve) evalIBORSwapNPV(quotedDates []time.Time, pseudoDF map[time.Time]float64, oisCurve *Curve, parRate float64, unknownPseudoDF float64, floatFreqMonths int) (float64, float64) {
+// iborSwapLegs holds the parts of an IBOR par swap that stay fixed while the
+// bootstrap solves for the pseudo-DF at its maturity.
+type iborSwapLegs struct {
+	floatingDates []time.Time
+	floatAccruals []float64 // accrual of period i, ending at floatingDates[i+1]
+	floatOISDFs   []float64 // OIS DF at floatingDates[i+1]
+	fixedPV       float64
+}
+
+// buildIBORSwapLegs generates the floating schedule (using floatFreqMonths, not c.freqMonths)
+// and prices the fixed leg at parRate, both discounted on the OIS curve.
+func (c *Curve) buildIBORSwapLegs(quotedDates []time.Time, oisCurve *Curve, parRate float64, floatFreqMonths int) iborSwapLegs {
 	start := quotedDates[0]
 	maturity := quotedDates[len(quotedDates)-1]
 
@@ -586,17 +609,6 @@ func (c *Curve) evalIBORSwapNPV(quotedDates []time.Time, pseudoDF map[time.Time]
 		floatDayCount = "ACT/360"
 	}
 
-	// Create temporary pseudo-DF map including the unknown value
-	tempPseudoDF := make(map[time.Time]float64, len(pseudoDF)+1)
-	for k, v := range pseudoDF {
-		tempPseudoDF[k] = v
-	}
-	tempPseudoDF[maturity] = unknownPseudoDF
-
-	// Calculate floating leg PV
-	floatPV := 0.0
-	floatDerivative := 0.0
-
 	// Generate floating periods using the specified frequency (not c.freqMonths)
 	floatingDates := []time.Time{start}
 	curr := start
@@ -621,39 +633,14 @@ func (c *Curve) evalIBORSwapNPV(quotedDates []time.Time, pseudoDF map[time.Time]
 		floatingDates = append(floatingDates, maturity)
 	}
 
-	// Get previous pillar for interpolation derivative calculation
-	prevPillar := quotedDates[len(quotedDates)-2]
-
+	legs := iborSwapLegs{
+		floatingDates: floatingDates,
+		floatAccruals: make([]float64, len(floatingDates)-1),
+		floatOISDFs:   make([]float64, len(floatingDates)-1),
+	}
 	for i := 1; i < len(floatingDates); i++ {
-		periodStart := floatingDates[i-1]
-		periodEnd := floatingDates[i]
-		accrual := utils.YearFraction(periodStart, periodEnd, floatDayCount)
-
-		// Get pseudo-DFs at period boundaries (interpolate if needed)
-		pxStart := c.interpolatePseudoDiscountFactor(periodStart, tempPseudoDF, quotedDates)
-		pxEnd := c.interpolatePseudoDiscountFactor(periodEnd, tempPseudoDF, quotedDates)
-
-		// Forward rate
-		forward := (pxStart/pxEnd - 1.0) / accrual
-
-		// Discount at OIS
-		oisDF := oisCurve.DF(periodEnd)
-
-		// Cashflow PV
-		cf := forward * accrual * oisDF
-		floatPV += cf
-
-		// Derivative calculation: include contributions from all periods that depend on unknownPseudoDF
-		// For periods between prevPillar and maturity, the interpolated pseudo-DFs depend on the unknown
-		if periodEnd.After(prevPillar) {
-			// Calculate derivatives of pxStart and pxEnd w.r.t. unknownPseudoDF
-			dPxStart := c.interpolatePseudoDiscountFactorDerivative(periodStart, tempPseudoDF, quotedDates, maturity, unknownPseudoDF)
-			dPxEnd := c.interpolatePseudoDiscountFactorDerivative(periodEnd, tempPseudoDF, quotedDates, maturity, unknownPseudoDF)
-
-			// d(forward)/d(unknown) = (1/pxEnd * dPxStart - pxStart/pxEnd^2 * dPxEnd) / accrual
-			dForward := (dPxStart/pxEnd - pxStart*dPxEnd/(pxEnd*pxEnd)) / accrual
-			floatDerivative += accrual * oisDF * dForward
-		}
+		legs.floatAccruals[i-1] = utils.YearFraction(floatingDates[i-1], floatingDates[i], floatDayCount)
+		legs.floatOISDFs[i-1] = oisCurve.DF(floatingDates[i])
 	}
 
 	// Calculate fixed leg PV (pay fixed at parRate, discounted at OIS)
@@ -699,8 +686,58 @@ func (c *Curve) evalIBORSwapNPV(quotedDates []time.Time, pseudoDF map[time.Time]
 		fixedPV += oisDF * accrual * parRate
 	}
 
+	legs.fixedPV = fixedPV
+	return legs
+}
+
+// evalIBORSwapNPV evaluates IBOR swap NPV for a trial pseudo-DF at maturity.
+// tempPseudoDF holds the solved pseudo-DFs; its maturity entry is overwritten with unknownPseudoDF.
+func (c *Curve) evalIBORSwapNPV(quotedDates []time.Time, tempPseudoDF map[time.Time]float64, legs iborSwapLegs, unknownPseudoDF float64) (float64, float64) {
+	maturity := quotedDates[len(quotedDates)-1]
+	tempPseudoDF[maturity] = unknownPseudoDF
+
+	// Calculate floating leg PV
+	floatPV := 0.0
+	floatDerivative := 0.0
+
+	// Get previous pillar for interpolation derivative calculation
+	prevPillar := quotedDates[len(quotedDates)-2]
+
+	floatingDates := legs.floatingDates
+	for i := 1; i < len(floatingDates); i++ {
+		periodStart := floatingDates[i-1]
+		periodEnd := floatingDates[i]
+		accrual := legs.floatAccruals[i-1]
+
+		// Get pseudo-DFs at period boundaries (interpolate if needed)
+		pxStart := c.interpolatePseudoDiscountFactor(periodStart, tempPseudoDF, quotedDates)
+		pxEnd := c.interpolatePseudoDiscountFactor(periodEnd, tempPseudoDF, quotedDates)
+
+		// Forward rate
+		forward := (pxStart/pxEnd - 1.0) / accrual
+
+		// Discount at OIS
+		oisDF := legs.floatOISDFs[i-1]
+
+		// Cashflow PV
+		cf := forward * accrual * oisDF
+		floatPV += cf
+
+		// Derivative calculation: include contributions from all periods that depend on unknownPseudoDF
+		// For periods between prevPillar and maturity, the interpolated pseudo-DFs depend on the unknown
+		if periodEnd.After(prevPillar) {
+			// Calculate derivatives of pxStart and pxEnd w.r.t. unknownPseudoDF
+			dPxStart := c.interpolatePseudoDiscountFactorDerivative(periodStart, tempPseudoDF, quotedDates, maturity, unknownPseudoDF)
+			dPxEnd := c.interpolatePseudoDiscountFactorDerivative(periodEnd, tempPseudoDF, quotedDates, maturity, unknownPseudoDF)
+
+			// d(forward)/d(unknown) = (1/pxEnd * dPxStart - pxStart/pxEnd^2 * dPxEnd) / accrual
+			dForward := (dPxStart/pxEnd - pxStart*dPxEnd/(pxEnd*pxEnd)) / accrual
+			floatDerivative += accrual * oisDF * dForward
+		}
+	}
+
 	// NPV = floatPV - fixedPV (receive float, pay fixed)
-	npv := floatPV - fixedPV
+	npv := floatPV - legs.fixedPV
 
 	return npv, floatDerivative
 }
@@ -783,6 +820,8 @@ func (c *Curve) buildZero() map[time.Time]float64 {
 	return zc
 }
 
+// paymentDatesToTenor maps each grid date to its tenor in years. Builders compute it
+// once and share it between the par curve and the bootstrap.
 func (c *Curve) paymentDatesToTenor() map[time.Time]float64 {
 	m := make(map[time.Time]float64, len(c.paymentDates))
 	for i, d := range c.paymentDates {
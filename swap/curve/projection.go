@@ -42,8 +42,9 @@ func BuildDualCurveWithFreq(settlement time.Time, iborQuotes map[string]float64,
 		curveDayCount: oisCurve.curveDayCount,
 	}
 	c.paymentDates = c.generatePaymentDates()
-	c.parRates = c.buildParCurve()
-	c.discountFactors = c.bootstrapDualCurve(oisCurve, floatFreqMonths)
+	dateToTenor := c.paymentDatesToTenor()
+	c.parRates = c.buildParCurve(dateToTenor)
+	c.discountFactors = c.bootstrapDualCurve(dateToTenor, oisCurve, floatFreqMonths)
 	c.zeros = c.buildZero()
 	return c
 }
@@ -8,20 +8,23 @@ import (
 // tenorToYears converts tenor strings like "1W", "3M", "10Y" to year fractions.
 func tenorToYears(tenor string) float64 {
 	tenor = strings.TrimSpace(strings.ToUpper(tenor))
-	if strings.HasSuffix(tenor, "W") {
-		v, _ := strconv.Atoi(strings.TrimSuffix(tenor, "W"))
-		return float64(v) * 7.0 / 365.0
+	if tenor == "" {
+		return 0
 	}
-	if strings.HasSuffix(tenor, "M") {
-		v, _ := strconv.Atoi(strings.TrimSuffix(tenor, "M"))
+	// Dispatch on the unit suffix once instead of probing each unit in turn.
+	num := tenor[:len(tenor)-1]
+	switch tenor[len(tenor)-1] {
+	case 'W':
+		v, _ := strconv.Atoi(num)
+		return float64(v) * 7.0 / 365.0
+	case 'M':
+		v, _ := strconv.Atoi(num)
 		return float64(v) / 12.0
-	}
-	if strings.HasSuffix(tenor, "Y") {
-		v, _ := strconv.Atoi(strings.TrimSuffix(tenor, "Y"))
+	case 'Y':
+		v, _ := strconv.Atoi(num)
 		return float64(v)
-	}
-	if strings.HasSuffix(tenor, "D") {
-		v, _ := strconv.Atoi(strings.TrimSuffix(tenor, "D"))
+	case 'D':
+		v, _ := strconv.Atoi(num)
 		return float64(v) / 365.0
 	}
 	// default attempt parse as years